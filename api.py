@@ -1,37 +1,113 @@
-from fastapi import FastAPI, Query, HTTPException, Depends
-from fastapi.concurrency import run_in_threadpool
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, field_validator, Field
+import asyncio
+import hashlib
+import logging
+import operator
+import os
+import time
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Query, HTTPException, Depends, Request
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, AsyncIterator, Iterable, Iterator, Tuple
+from typing_extensions import TypedDict
+from pydantic import BaseModel, TypeAdapter, ValidationError, field_validator, Field
 from datetime import datetime
-from fundus import PublisherCollection, Article
+from fundus import Article
+from fundus.scraping.session import session_handler
 from crawlers import BodyFilterCrawler, UrlFilterCrawler
 from crawlers.base_crawler import (
+    ASYNC_TIMEOUT_GRACE_SECONDS,
     CrawlerError,
     NetworkError,
     TimeoutError,
-    PUBLISHER_COLLECTIONS,
-    PUBLISHER_COLLECTIONS_LIST,
+    SOURCE_MAPPING,
+    VALID_SOURCE_DISPLAY_SORTED,
+    normalize_source_name,
 )
 
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # fundus builds each publisher's parser on first use; do that now so the
+    # first crawl request doesn't pay for it
+    for source in _ALL_SOURCES:
+        source.parser()
+    # The crawl slots and threads are made per startup: the semaphore belongs to the
+    # running event loop, and the executor is shut down again below.
+    # Each crawl fans out to every selected publisher, so cap how many run at once
+    app.state.crawl_sema = asyncio.Semaphore(int(os.getenv("MAX_PARALLEL_CRAWLS", "4")))
+    # Crawls run on their own threads so they can't starve Starlette's shared threadpool.
+    # Sized above MAX_PARALLEL_CRAWLS because a timed-out crawl holds its thread until
+    # it notices the timeout.
+    app.state.crawl_executor = ThreadPoolExecutor(
+        max_workers=int(os.getenv("CRAWLER_THREADPOOL", "8")),
+        thread_name_prefix="crawler",
+    )
+    yield
+    # Don't wait for crawls that outlived their request's timeout
+    app.state.crawl_executor.shutdown(wait=False, cancel_futures=True)
+    # fundus keeps one pooled requests.Session for all publishers; make sure its
+    # connections are released when the server stops
+    session_handler.close_current_session()
+
+
 app = FastAPI(
     title="News Crawler API",
     description="API for crawling news articles from various sources",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Initialize app state
 app.state.use_mock = False
 
+# How long a request waits for a free crawl slot before getting a 503
+CRAWL_QUEUE_TIMEOUT_SECONDS = 5
+CRAWL_SLOTS_BUSY_MESSAGE = "Too many crawls in progress, please try again shortly"
+
+
+# Every publisher, for requests that don't name any sources
+_ALL_SOURCES = tuple(source for _, source in SOURCE_MAPPING.values())
+
+
+def invalid_sources_error(invalid_sources: List[str]) -> ValueError:
+    return ValueError(
+        f"Invalid source(s): {', '.join(invalid_sources)}. "
+        f"Valid sources are: {', '.join(VALID_SOURCE_DISPLAY_SORTED)}"
+    )
+
 
 class ArticleResponse(BaseModel):
     title: str
     url: str
-    publishing_date: datetime
+    publishing_date: str
     body: str
     authors: Optional[List[str]] = []  # Made optional with default empty list
     source: str
 
 
+class ArticleData(TypedDict):
+    """ArticleResponse's fields as a plain dict, so articles can be validated and
+    serialized without building a model object for each one."""
+
+    title: str
+    url: str
+    publishing_date: str
+    body: str
+    authors: Optional[List[str]]
+    source: str
+
+
+# Validates a whole crawl's articles in one call
+_ARTICLES_ADAPTER = TypeAdapter(List[ArticleData])
+_ARTICLE_ADAPTER = TypeAdapter(ArticleData)
+
+
 class CrawlerResponse(BaseModel):
     articles: List[ArticleResponse]
     message: str = "Success"
@@ -39,17 +115,17 @@ class CrawlerResponse(BaseModel):
 
 
 class CrawlerParams(BaseModel):
-    max_articles: Optional[int] = Field(
-        None, ge=1, description="Maximum number of articles to retrieve"
+    # Bounded so one request can't hold an open-ended number of article bodies
+    max_articles: int = Field(
+        1000,
+        ge=1,
+        le=10000,
+        description="Maximum number of articles to retrieve (default: 1000, at most 10000)",
     )
     days_back: int = Field(7, ge=1, description="Number of days back to search")
     timeout: Optional[int] = Field(
         25, ge=1, description="Maximum number of seconds to run the query (default: 25)"
     )
-    sources: Optional[List[str]] = Field(
-        None,
-        description="List of sources to crawl (e.g., ['TheNewYorker', 'TheGuardian']). If not specified, uses all US, UK, Australian, and Canadian sources",
-    )
 
     @field_validator("days_back")
     def validate_days_back(cls, v):
@@ -57,44 +133,6 @@ class CrawlerParams(BaseModel):
             raise ValueError("days_back must be greater than 0")
         return v
 
-    @field_validator("sources")
-    def validate_sources(cls, v):
-        if not v:
-            return None
-
-        # Create a mapping of normalized names to actual source names
-        source_mapping = {}
-        for collection in PUBLISHER_COLLECTIONS_LIST:
-            for name, source in vars(collection).items():
-                if not name.startswith("__"):
-                    source_mapping[normalize_source_name(name)] = name
-
-        invalid_sources = []
-        for source in v:
-            normalized_name = normalize_source_name(source)
-            if normalized_name not in source_mapping:
-                invalid_sources.append(source)
-
-        if invalid_sources:
-            # Get list of valid sources with their display names
-            valid_sources = {}
-            for collection in PUBLISHER_COLLECTIONS_LIST:
-                for name, source in vars(collection).items():
-                    if not name.startswith("__"):
-                        display_name = " ".join(
-                            word for word in name if word.isupper() or word == name[0]
-                        )
-                        valid_sources[name] = display_name
-
-            valid_source_display = [
-                f"{display} ({name})" for name, display in valid_sources.items()
-            ]
-            raise ValueError(
-                f"Invalid source(s): {', '.join(invalid_sources)}. "
-                f"Valid sources are: {', '.join(sorted(valid_source_display))}"
-            )
-        return v
-
 
 def handle_crawler_error(e: Exception) -> Dict[str, Any]:
     if isinstance(e, TimeoutError):
@@ -107,215 +145,377 @@ def handle_crawler_error(e: Exception) -> Dict[str, Any]:
         raise HTTPException(status_code=500, detail="An unexpected error occurred")
 
 
-def article_to_dict(article: Article) -> Dict[str, Any]:
-    """Convert an article to a dictionary format matching ArticleResponse."""
-    try:
-        # Ensure publishing_date is a datetime object
-        if isinstance(article.publishing_date, str):
-            # If it's a string, try to parse it as a datetime
-            pub_date = datetime.fromisoformat(
-                article.publishing_date.replace("Z", "+00:00")
+def _keep_date_string(value: str) -> str:
+    return value
+
+
+def _format_date(value: datetime) -> str:
+    return value.isoformat()
+
+
+# Map common domains to their proper names
+_DOMAIN_SOURCE_NAMES = {
+    "theguardian.com": "The Guardian",
+    "newyorker.com": "The New Yorker",
+    "wired.com": "Wired",
+    "theatlantic.com": "The Atlantic",
+    "nytimes.com": "The New York Times",
+    "washingtonpost.com": "The Washington Post",
+    "bbc.com": "BBC",
+    "reuters.com": "Reuters",
+}
+
+
+# Reads the fields every article type shares in one call
+_ARTICLE_FIELDS = operator.attrgetter("title", "publishing_date", "body", "authors")
+
+
+class ArticleSerializer:
+    """Converts articles to dictionaries matching ArticleResponse.
+
+    Articles from one crawl are all of the same kind and carry the same kind of
+    publishing date, so how to read the URL and source, and how to convert the
+    date, are chosen from the first article and reused for the rest.
+
+    rendered_bodies maps id(body) to (body, text) for bodies the crawler already
+    rendered while filtering; those are used instead of rendering them again.
+    """
+
+    def __init__(self, rendered_bodies: Optional[Dict[int, Tuple[Any, str]]] = None):
+        self._rendered_bodies = rendered_bodies
+        self._convert_date = None
+        self._url_and_source = None
+        # Articles that could not be converted
+        self.skipped = 0
+
+    @staticmethod
+    def _mock_url_and_source(article) -> Tuple[str, str]:
+        return article.url, article.source
+
+    @staticmethod
+    def _fundus_url_and_source(article: Article) -> Tuple[str, str]:
+        url = article.html.requested_url
+        source = getattr(article.publisher, "name", None)
+        if source is None:
+            # Fallback to URL-based source name
+            domain = url.split("/")[2].replace("www.", "")
+            source = _DOMAIN_SOURCE_NAMES.get(domain, domain)
+        return url, source
+
+    def to_dict(self, article: Article) -> Dict[str, Any]:
+        """Convert an article to a dictionary format matching ArticleResponse."""
+        if self._convert_date is None:
+            # String dates are passed through; datetimes are formatted once here
+            self._convert_date = (
+                _keep_date_string
+                if isinstance(article.publishing_date, str)
+                else _format_date
+            )
+            # MockArticle carries url and source itself; fundus articles only have the html
+            self._url_and_source = (
+                self._mock_url_and_source
+                if hasattr(article, "source")
+                else self._fundus_url_and_source
             )
-        else:
-            # If it's already a datetime or similar, use it as is
-            pub_date = article.publishing_date
-
-        # Convert body to string if it's not already
-        body = str(article.body) if hasattr(article, "body") else ""
-
-        # Handle source name based on article type
-        if hasattr(article, "source"):  # For MockArticle
-            source = article.source
-        elif hasattr(article, "html") and hasattr(article.html, "requested_url"):
-            # For fundus Article, try to get the publisher name
-            if hasattr(article, "publisher") and hasattr(article.publisher, "name"):
-                source = article.publisher.name
-            else:
-                # Fallback to URL-based source name
-                url = article.html.requested_url
-                domain = url.split("/")[2].replace("www.", "")
-                # Map common domains to their proper names
-                source_map = {
-                    "theguardian.com": "The Guardian",
-                    "newyorker.com": "The New Yorker",
-                    "wired.com": "Wired",
-                    "theatlantic.com": "The Atlantic",
-                    "nytimes.com": "The New York Times",
-                    "washingtonpost.com": "The Washington Post",
-                    "bbc.com": "BBC",
-                    "reuters.com": "Reuters",
-                }
-                source = source_map.get(domain, domain)
-        else:
-            source = "Unknown"
 
+        url, source = self._url_and_source(article)
+        title, publishing_date, body, authors = _ARTICLE_FIELDS(article)
+        rendered = self._rendered_bodies and self._rendered_bodies.pop(id(body), None)
         return {
-            "title": article.title,
-            "url": (
-                article.url if hasattr(article, "url") else article.html.requested_url
-            ),
-            "publishing_date": pub_date,
-            "body": body,
-            "authors": getattr(article, "authors", []),
+            "title": title,
+            "url": url,
+            "publishing_date": self._convert_date(publishing_date),
+            "body": rendered[1] if rendered else str(body),
+            "authors": authors or [],
             "source": source,
         }
-    except AttributeError as e:
-        print(f"Error processing article: {str(e)}")
-        raise HTTPException(
-            status_code=422, detail=f"Error processing article data: {str(e)}"
-        )
 
 
-def normalize_source_name(name: str) -> str:
-    """Normalize source name by removing spaces and special characters."""
-    return "".join(name.split())
+@lru_cache(maxsize=256)
+def _resolve_sources(normalized_names: Tuple[str, ...]) -> Tuple[Any, ...]:
+    """Map validated, normalized names to publishers (clients tend to repeat the same selections)."""
+    return tuple(SOURCE_MAPPING[name][1] for name in normalized_names)
 
 
 def get_sources(source_names: Optional[List[str]] = None):
     if not source_names:
-        sources = [
-            source
-            for collection in PUBLISHER_COLLECTIONS.values()
-            for name, source in vars(collection).items()
-            if not name.startswith("__")
-        ]
-        print(f"No sources specified, returning all sources: {len(sources)} sources")
-        return sources
-
-    print(f"Requested sources: {source_names}")
-    sources = []
-    invalid_sources = []
-
-    # Create a mapping of normalized names to actual source names
-    source_mapping = {}
-    for collection in PUBLISHER_COLLECTIONS_LIST:
-        for name, source in vars(collection).items():
-            if not name.startswith("__"):
-                source_mapping[normalize_source_name(name)] = (name, source)
-
-    for name in source_names:
-        normalized_name = normalize_source_name(name)
-        if normalized_name in source_mapping:
-            _, source = source_mapping[normalized_name]
-            sources.append(source)
-        else:
-            invalid_sources.append(name)
-            print(f"Source not found: {name}")
-
+        logger.debug(
+            "No sources specified, returning all sources: %d sources", len(_ALL_SOURCES)
+        )
+        return _ALL_SOURCES
+
+    logger.debug("Requested sources: %s", source_names)
+    # Requested name -> normalized name, in request order and without repeats
+    normalized_names = {name: normalize_source_name(name) for name in source_names}
+    invalid_sources = [
+        name
+        for name, normalized_name in normalized_names.items()
+        if normalized_name not in SOURCE_MAPPING
+    ]
     if invalid_sources:
-        # Get list of valid sources with their display names
-        valid_sources = {}
-        for collection in PUBLISHER_COLLECTIONS_LIST:
-            for name, source in vars(collection).items():
-                if not name.startswith("__"):
-                    display_name = " ".join(
-                        word for word in name if word.isupper() or word == name[0]
-                    )
-                    valid_sources[name] = display_name
-
-        valid_source_display = [
-            f"{display} ({name})" for name, display in valid_sources.items()
-        ]
-        raise ValueError(
-            f"Invalid source(s): {', '.join(invalid_sources)}. "
-            f"Valid sources are: {', '.join(sorted(valid_source_display))}"
+        logger.debug("Sources not found: %s", invalid_sources)
+        raise invalid_sources_error(invalid_sources)
+
+    sources = _resolve_sources(tuple(dict.fromkeys(normalized_names.values())))
+    # Skip building the name list entirely unless debug logging is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Returning %d sources: %s",
+            len(sources),
+            [s.name if hasattr(s, "name") else str(s) for s in sources],
         )
-
-    if not sources:
-        raise ValueError("No valid sources provided")
-
-    print(
-        f"Returning {len(sources)} sources: {[s.name if hasattr(s, 'name') else str(s) for s in sources]}"
-    )
     return sources
 
 
 def parse_sources(
-    sources_param: Optional[str], params_sources: Optional[List[str]]
+    sources: Optional[List[str]] = Query(
+        None,
+        description="Sources to crawl, as repeated parameters or comma-separated (e.g., 'TheNewYorker,TheGuardian'). If not specified, uses all sources",
+    ),
 ) -> Optional[List[str]]:
-    """Parse sources from either comma-separated string or params list."""
-    if sources_param:
-        return [s.strip() for s in sources_param.split(",")]
-    return params_sources
+    """Collect the sources query parameters into a list of names."""
+    return expand_terms(sources) if sources else None
 
 
 def expand_terms(terms: List[str]) -> List[str]:
-    """Split comma-separated terms into individual terms and clean them."""
-    expanded = []
-    for term in terms:
-        if "," in term:
-            expanded.extend(t.strip() for t in term.split(","))
-        else:
-            expanded.append(term.strip())
-    return expanded
+    """Split comma-separated terms into individual terms, clean them and drop repeats."""
+    return list(
+        dict.fromkeys(
+            stripped
+            for term in terms
+            for part in term.split(",")
+            if (stripped := part.strip())
+        )
+    )
 
 
-async def handle_crawler_request(
+# Identical searches within this many seconds are answered from memory instead of re-crawling
+RESPONSE_CACHE_TTL_SECONDS = 120
+
+# Each entry can hold a whole crawl's article bodies, so only this many are kept
+RESPONSE_CACHE_MAX_ENTRIES = 32
+
+# Cache key -> (time stored, response body, ETag), oldest first
+_response_cache: Dict[str, Tuple[float, bytes, str]] = {}
+
+
+def response_cache_key(
     params: CrawlerParams,
     include: List[str],
     exclude: Optional[List[str]],
-    sources: Optional[str],
+    source_names: Optional[List[str]],
+    crawler_class,
+) -> str:
+    key_data = [
+        crawler_class.__name__,
+        app.state.use_mock,
+        sorted(normalize_source_name(name) for name in source_names or []),
+        sorted(include),
+        sorted(exclude or []),
+        params.days_back,
+        params.max_articles,
+        params.timeout,
+    ]
+    return hashlib.blake2b(orjson.dumps(key_data), digest_size=16).hexdigest()
+
+
+def get_cached_response(key: str) -> Optional[Tuple[bytes, str]]:
+    cached = _response_cache.get(key)
+    if cached is None:
+        return None
+    stored_at, body, etag = cached
+    if time.monotonic() - stored_at >= RESPONSE_CACHE_TTL_SECONDS:
+        del _response_cache[key]
+        return None
+    return body, etag
+
+
+def cache_response(key: str, body: bytes) -> str:
+    now = time.monotonic()
+    # Drop expired entries so the cache only holds recent searches
+    for expired_key in [
+        k
+        for k, (stored_at, _, _) in _response_cache.items()
+        if now - stored_at >= RESPONSE_CACHE_TTL_SECONDS
+    ]:
+        del _response_cache[expired_key]
+    # Re-inserting moves the key to the end, keeping the dict in age order
+    _response_cache.pop(key, None)
+    while len(_response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+        del _response_cache[next(iter(_response_cache))]
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    _response_cache[key] = (now, body, etag)
+    return etag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag, using weak comparison."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def build_crawler(
+    params: CrawlerParams,
+    include: List[str],
+    exclude: Optional[List[str]],
+    source_names: Optional[List[str]],
     crawler_class,
     timeout_seconds: Optional[int] = None,
-) -> CrawlerResponse:
-    try:
-        # Parse and validate sources
-        sources_list = parse_sources(sources, params.sources)
-
-        if app.state.use_mock:
-            from crawlers.mock_crawler import MockCrawler
-
-            crawler = MockCrawler(
-                sources_list,  # Pass the source names directly
-                params.max_articles,
-                params.days_back,
-                include,
-                exclude,
-                is_url_search=crawler_class.__name__
-                == "UrlFilterCrawler",  # Set based on crawler type
-            )
-        else:
-            sources = get_sources(sources_list)
-            if crawler_class.__name__ == "UrlFilterCrawler":
-                crawler = crawler_class(
-                    sources,
-                    params.max_articles,
-                    params.days_back,
-                    include,
-                    exclude,
-                    timeout_seconds,
-                )
-            else:  # BodyFilterCrawler
-                crawler = crawler_class(
-                    sources,
-                    params.max_articles,
-                    params.days_back,
-                    include,
-                    timeout_seconds,
-                )
+):
+    if app.state.use_mock:
+        from crawlers.mock_crawler import MockCrawler
+
+        return MockCrawler(
+            source_names,  # Pass the source names directly
+            params.max_articles,
+            params.days_back,
+            include,
+            exclude,
+            is_url_search=crawler_class.__name__
+            == "UrlFilterCrawler",  # Set based on crawler type
+        )
 
-        articles = await run_in_threadpool(
-            crawler.run_crawler, display_output=True, show_body=False
+    sources = get_sources(source_names)
+    if crawler_class.__name__ == "UrlFilterCrawler":
+        return crawler_class(
+            sources,
+            params.max_articles,
+            params.days_back,
+            include,
+            exclude,
+            timeout_seconds,
+            display_output=False,
         )
-        print(f"Crawler returned {len(articles)} articles")
+    # BodyFilterCrawler
+    return crawler_class(
+        sources,
+        params.max_articles,
+        params.days_back,
+        include,
+        timeout_seconds,
+        display_output=False,
+        # The serializer picks these up instead of rendering each body again
+        keep_rendered_bodies=True,
+    )
 
-        # Process articles
-        processed_articles = []
-        for article in articles:
-            try:
-                article_dict = article_to_dict(article)
-                processed_articles.append(ArticleResponse(**article_dict))
-            except Exception as e:
-                print(f"Error processing article: {type(e).__name__}: {str(e)}")
+
+def serialize_articles(
+    articles: Iterable[Article], serializer: Optional[ArticleSerializer] = None
+) -> Iterator[Dict[str, Any]]:
+    """Convert articles to dicts, dropping repeated URLs and articles that fail.
+
+    Failed articles are counted on the serializer's skipped attribute.
+    """
+    # Syndicated stories can show up under more than one publisher
+    seen_urls = set()
+    serializer = serializer or ArticleSerializer()
+    for article in articles:
+        try:
+            url = article.html.requested_url
+            if url in seen_urls:
                 continue
+            seen_urls.add(url)
+            yield serializer.to_dict(article)
+        except Exception as e:
+            serializer.skipped += 1
+            logger.warning("Error processing article: %s: %s", type(e).__name__, e)
 
-        return CrawlerResponse(
-            articles=processed_articles,
-            message=f"Found {len(processed_articles)} article(s)",
+
+def validate_articles(article_dicts: List[Dict[str, Any]]) -> List[ArticleData]:
+    try:
+        return _ARTICLES_ADAPTER.validate_python(article_dicts)
+    except ValidationError:
+        # Only go article by article when the batch has a bad entry, so it can be skipped
+        valid_articles = []
+        for article_dict in article_dicts:
+            try:
+                valid_articles.append(_ARTICLE_ADAPTER.validate_python(article_dict))
+            except ValidationError as e:
+                logger.warning("Skipping invalid article: %s", e)
+        return valid_articles
+
+
+async def acquire_crawl_slot() -> bool:
+    """Wait briefly for a free crawl slot; False if none frees up in time."""
+    try:
+        await asyncio.wait_for(
+            app.state.crawl_sema.acquire(), timeout=CRAWL_QUEUE_TIMEOUT_SECONDS
+        )
+    except asyncio.TimeoutError:
+        logger.warning("All crawl slots busy, rejecting request")
+        return False
+    return True
+
+
+async def handle_crawler_request(
+    params: CrawlerParams,
+    include: List[str],
+    exclude: Optional[List[str]],
+    source_names: Optional[List[str]],
+    crawler_class,
+    timeout_seconds: Optional[int] = None,
+    if_none_match: Optional[str] = None,
+) -> Response:
+    cache_key = response_cache_key(
+        params, include, exclude, source_names, crawler_class
+    )
+    if cached := get_cached_response(cache_key):
+        body, etag = cached
+        logger.debug("Serving cached response %s", etag)
+        if etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        return Response(
+            content=body, media_type="application/json", headers={"ETag": etag}
+        )
+
+    if not await acquire_crawl_slot():
+        raise HTTPException(status_code=503, detail=CRAWL_SLOTS_BUSY_MESSAGE)
+
+    try:
+        try:
+            crawler = build_crawler(
+                params, include, exclude, source_names, crawler_class, timeout_seconds
+            )
+            articles = await crawler.run_crawler_async(
+                display_output=False,
+                show_body=False,
+                executor=app.state.crawl_executor,
+            )
+        finally:
+            app.state.crawl_sema.release()
+        logger.debug("Crawler returned %d articles", len(articles))
+
+        serializer = ArticleSerializer(getattr(crawler, "rendered_bodies", None))
+        article_dicts = list(serialize_articles(articles, serializer))
+        processed_articles = validate_articles(article_dicts)
+        skipped = serializer.skipped + len(article_dicts) - len(processed_articles)
+        message = f"Found {len(processed_articles)} article(s)"
+        if skipped:
+            message += f" ({skipped} skipped because they could not be processed)"
+
+        # Same shape as CrawlerResponse, dumped straight from the validated dicts
+        body = orjson.dumps(
+            {
+                "articles": processed_articles,
+                "message": message,
+                "error": None,
+            }
+        )
+        if crawler.timed_out:
+            # A crawl cut short by its timeout is partial; a later request may get further
+            return Response(content=body, media_type="application/json")
+        etag = cache_response(cache_key, body)
+        return Response(
+            content=body, media_type="application/json", headers={"ETag": etag}
         )
 
     except Exception as e:
-        print(f"Error in crawler request: {type(e).__name__}: {str(e)}")
+        logger.error("Error in crawler request: %s: %s", type(e).__name__, e)
         if isinstance(e, (AttributeError, TypeError)):
             raise HTTPException(
                 status_code=422, detail=f"Error processing article data: {str(e)}"
@@ -327,30 +527,108 @@ async def handle_crawler_request(
 
 @app.get("/crawl/body", response_model=CrawlerResponse)
 async def crawl_body(
+    request: Request,
     params: CrawlerParams = Depends(),
     include: List[str] = Query(
         ..., description="Required keywords to include in search"
     ),
-    sources: Optional[str] = Query(
-        None,
-        description="Comma-separated list of sources to crawl (e.g., 'TheNewYorker,TheGuardian'). If not specified, uses all sources",
-    ),
+    source_names: Optional[List[str]] = Depends(parse_sources),
 ):
     expanded_include = expand_terms(include)
-    print(f"Include terms: {expanded_include}")
+    logger.debug("Include terms: %s", expanded_include)
 
     return await handle_crawler_request(
         params,
         expanded_include,
         None,  # exclude parameter is not used for body search
-        sources,
+        source_names,
         BodyFilterCrawler,
         params.timeout,
+        request.headers.get("if-none-match"),
+    )
+
+
+async def iter_ndjson_articles(crawler) -> AsyncIterator[bytes]:
+    """Serialize articles to NDJSON lines as the crawler yields them.
+
+    Like the buffered endpoints, a stream takes a crawl slot and pulls articles
+    on the crawl executor, so streams count towards MAX_PARALLEL_CRAWLS too.
+    """
+    # The response has already started by now, so failures are reported as a final line
+    if not await acquire_crawl_slot():
+        yield orjson.dumps({"error": CRAWL_SLOTS_BUSY_MESSAGE}) + b"\n"
+        return
+
+    loop = asyncio.get_running_loop()
+    article_dicts = serialize_articles(
+        crawler.iter_articles(display_output=False, show_body=False),
+        ArticleSerializer(getattr(crawler, "rendered_bodies", None)),
+    )
+    # The crawl only checks its timeout when an article arrives, so each wait is
+    # bounded too; otherwise a stalled publisher would hold the crawl slot indefinitely
+    deadline = (
+        loop.time() + crawler.timeout_seconds + ASYNC_TIMEOUT_GRACE_SECONDS
+        if crawler.timeout_seconds
+        else None
+    )
+    try:
+        while True:
+            pull = loop.run_in_executor(
+                app.state.crawl_executor, next, article_dicts, None
+            )
+            try:
+                article_dict = await asyncio.wait_for(
+                    pull, timeout=deadline - loop.time() if deadline else None
+                )
+            except asyncio.TimeoutError:
+                # Ends the stream the same way the crawl's own timeout does
+                logger.warning(
+                    "Streaming crawl timed out after %s seconds",
+                    crawler.timeout_seconds,
+                )
+                break
+            if article_dict is None:
+                break
+            yield orjson.dumps(article_dict) + b"\n"
+    except Exception as e:
+        logger.error("Error in streaming crawler request: %s: %s", type(e).__name__, e)
+        yield orjson.dumps({"error": str(e)}) + b"\n"
+    finally:
+        app.state.crawl_sema.release()
+
+
+@app.get("/crawl/body/stream")
+async def crawl_body_stream(
+    params: CrawlerParams = Depends(),
+    include: List[str] = Query(
+        ..., description="Required keywords to include in search"
+    ),
+    source_names: Optional[List[str]] = Depends(parse_sources),
+):
+    """Stream /crawl/body results as NDJSON, one article per line."""
+    expanded_include = expand_terms(include)
+    logger.debug("Include terms: %s", expanded_include)
+
+    try:
+        crawler = build_crawler(
+            params,
+            expanded_include,
+            None,  # exclude parameter is not used for body search
+            source_names,
+            BodyFilterCrawler,
+            params.timeout,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(
+        iter_ndjson_articles(crawler), media_type="application/x-ndjson"
     )
 
 
 @app.get("/crawl/url", response_model=CrawlerResponse)
 async def crawl_url(
+    request: Request,
     params: CrawlerParams = Depends(),
     include: List[str] = Query(
         ..., description="Required keywords to include in search"
@@ -358,24 +636,57 @@ async def crawl_url(
     exclude: Optional[List[str]] = Query(
         None, description="Optional keywords to exclude from search"
     ),
-    sources: Optional[str] = Query(
-        None,
-        description="Comma-separated list of sources to crawl (e.g., 'TheNewYorker,TheGuardian'). If not specified, uses all sources",
-    ),
+    source_names: Optional[List[str]] = Depends(parse_sources),
 ):
     expanded_include = expand_terms(include)
     expanded_exclude = expand_terms(exclude) if exclude else None
-    print(f"Include terms: {expanded_include}")
+    logger.debug("Include terms: %s", expanded_include)
     if expanded_exclude:
-        print(f"Exclude terms: {expanded_exclude}")
+        logger.debug("Exclude terms: %s", expanded_exclude)
 
     return await handle_crawler_request(
         params,
         expanded_include,
         expanded_exclude,
-        sources,
+        source_names,
         UrlFilterCrawler,
         params.timeout,
+        request.headers.get("if-none-match"),
+    )
+
+
+@app.get("/crawl/url/stream")
+async def crawl_url_stream(
+    params: CrawlerParams = Depends(),
+    include: List[str] = Query(
+        ..., description="Required keywords to include in search"
+    ),
+    exclude: Optional[List[str]] = Query(
+        None, description="Optional keywords to exclude from search"
+    ),
+    source_names: Optional[List[str]] = Depends(parse_sources),
+):
+    """Stream /crawl/url results as NDJSON, one article per line."""
+    expanded_include = expand_terms(include)
+    expanded_exclude = expand_terms(exclude) if exclude else None
+    logger.debug("Include terms: %s", expanded_include)
+    if expanded_exclude:
+        logger.debug("Exclude terms: %s", expanded_exclude)
+
+    try:
+        crawler = build_crawler(
+            params,
+            expanded_include,
+            expanded_exclude,
+            source_names,
+            UrlFilterCrawler,
+            params.timeout,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(
+        iter_ndjson_articles(crawler), media_type="application/x-ndjson"
     )
 
 
@@ -383,5 +694,5 @@ async def crawl_url(
 async def set_mock_state(state: bool):
     """Toggle mock mode on/off."""
     app.state.use_mock = state
-    print(f"\nMock mode {'enabled' if state else 'disabled'}.")
+    logger.info("Mock mode %s.", "enabled" if state else "disabled")
     return {"message": f"Mock mode set to: {state}"}
@@ -1,23 +1,183 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from abc import ABC, abstractmethod
+import asyncio
+from concurrent.futures import Executor
 import datetime
+import functools
+import re
 import time
-import threading
 import requests
+import requests.adapters
 import signal
-from fundus import Crawler, PublisherCollection, Sitemap, Article
+import threading
+from urllib.parse import urlparse
+from fundus import Crawler, PublisherCollection, Article
+from fundus.publishers.base_objects import Publisher
+from fundus.scraping.session import session_handler
+from urllib3.util.retry import Retry
 from crawlers.helpers import display, print_divider
-from crawlers.mock_data import normalize_source_name
-
 
-def timeout_handler(timeout_event):
-    timeout_event.set()
+# Extra time run_crawler_async gives the crawl to notice its own timeout before giving up on it
+ASYNC_TIMEOUT_GRACE_SECONDS = 1
+
+# Network retries back off exponentially from the base delay, up to the max
+RETRY_BASE_DELAY_SECONDS = 0.5
+RETRY_MAX_DELAY_SECONDS = 30
+
+# Retries for each request fundus makes, done by urllib3 inside the connection pool.
+# 429 is left out and Retry-After is ignored, since a publisher's Retry-After can be
+# longer than any crawl timeout and urllib3 would sleep through it in fundus's fetch thread.
+FETCH_RETRIES = Retry(
+    total=3,
+    backoff_factor=RETRY_BASE_DELAY_SECONDS,
+    backoff_max=RETRY_MAX_DELAY_SECONDS,
+    # Keeps crawls that failed at the same moment from retrying in lockstep
+    backoff_jitter=RETRY_BASE_DELAY_SECONDS / 2,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=("GET", "HEAD"),
+    respect_retry_after_header=False,
+    # Let the final response through so fundus's own error handling sees it
+    raise_on_status=False,
+)
 
 
 def cli_timeout_handler(signum, frame):
     raise TimeoutError("Crawler operation timed out")
 
 
+# After this many failed requests in a row a publisher host is skipped for the cooldown,
+# then a single probe request decides whether it is back
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_COOLDOWN_SECONDS = 60
+
+
+class HostCircuitBreaker:
+    """Stops sending requests to a publisher host that keeps failing.
+
+    fundus fetches each publisher in its own thread, so the state is kept behind a lock.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        cooldown_seconds: float = BREAKER_COOLDOWN_SECONDS,
+    ):
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._hosts: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, host: str) -> bool:
+        with self._lock:
+            breaker = self._hosts.get(host)
+            if breaker is None or breaker["state"] == "closed":
+                return True
+            if time.monotonic() - breaker["opened_at"] < self.cooldown_seconds:
+                return False
+            # Let one probe through; it gets a full cooldown to come back
+            breaker["state"] = "half_open"
+            breaker["opened_at"] = time.monotonic()
+            return True
+
+    def record_success(self, host: str):
+        with self._lock:
+            self._hosts.pop(host, None)
+
+    def record_failure(self, host: str):
+        with self._lock:
+            breaker = self._hosts.setdefault(
+                host, {"state": "closed", "failures": 0, "opened_at": 0.0}
+            )
+            breaker["failures"] += 1
+            if (
+                breaker["state"] == "half_open"
+                or breaker["failures"] >= self.failure_threshold
+            ):
+                breaker["state"] = "open"
+                breaker["opened_at"] = time.monotonic()
+
+
+# Shared by every crawl in the process, like fundus's session
+host_breaker = HostCircuitBreaker()
+
+
+class CircuitBreakerAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter that turns requests to an open host into connection errors.
+
+    fundus skips a URL on a ConnectionError, so a dead host costs nothing until its
+    cooldown is over. A request counts as failed once urllib3 has run out of retries.
+    """
+
+    def __init__(self, breaker: HostCircuitBreaker, **kwargs):
+        self.breaker = breaker
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        host = urlparse(request.url).netloc
+        if not self.breaker.allow(host):
+            raise requests.exceptions.ConnectionError(
+                f"Skipped {host} while its circuit breaker is open", request=request
+            )
+        try:
+            response = super().send(request, **kwargs)
+        except requests.exceptions.RequestException:
+            self.breaker.record_failure(host)
+            raise
+        if response.status_code >= 500:
+            self.breaker.record_failure(host)
+        else:
+            self.breaker.record_success(host)
+        return response
+
+
+def mount_fetch_adapters():
+    """Give the session fundus is about to crawl with retries and the host breaker.
+
+    fundus (checked against 0.5.0) has no option for this and closes its shared session
+    at the end of every crawl, so this has to run at the start of each one.
+    """
+    session = session_handler.get_session()
+    for prefix, adapter in list(session.adapters.items()):
+        if not isinstance(adapter, CircuitBreakerAdapter):
+            session.mount(
+                prefix,
+                CircuitBreakerAdapter(
+                    host_breaker,
+                    pool_connections=session_handler.pool_connections,
+                    pool_maxsize=session_handler.pool_maxsize,
+                    max_retries=FETCH_RETRIES,
+                ),
+            )
+
+
+# Dates that news sites put in article paths, e.g. /2024/05/17/ or /2024/may/17/
+_URL_DATE_PATTERN = re.compile(r"/(\d{4})/(\d{1,2}|[a-z]{3})/(\d{1,2})/")
+_URL_MONTHS = {
+    name: number
+    for number, name in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun")
+        + ("jul", "aug", "sep", "oct", "nov", "dec"),
+        start=1,
+    )
+}
+# URL dates can be a day off the publishing date (time zones, articles dated
+# before they go out), so only URLs further outside the window are dropped
+URL_DATE_SLACK = datetime.timedelta(days=1)
+
+
+def url_date(url: str) -> Optional[datetime.date]:
+    """Return the date in an article URL's path, or None if it doesn't have one."""
+    match = _URL_DATE_PATTERN.search(url)
+    if not match:
+        return None
+    year, month, day = match.groups()
+    month = _URL_MONTHS.get(month) if month.isalpha() else int(month)
+    try:
+        return datetime.date(int(year), month, int(day))
+    except (TypeError, ValueError):
+        return None
+
+
 class CrawlerError(Exception):
     """Base exception class for crawler errors"""
 
@@ -47,6 +207,91 @@ PUBLISHER_COLLECTIONS = {
 PUBLISHER_COLLECTIONS_LIST = list(PUBLISHER_COLLECTIONS.values())
 
 
+@functools.lru_cache(maxsize=None)
+def collection_members(collection) -> Tuple[Tuple[str, Publisher], ...]:
+    """Return the (attribute name, publisher) pairs of a publisher collection.
+
+    Collections never change at runtime, so each one is only introspected once.
+    """
+    return tuple(
+        (name, member)
+        for name in dir(collection)
+        if not name.startswith("_")
+        and isinstance(member := getattr(collection, name), Publisher)
+    )
+
+
+# Characters stripped from source names before lookup
+_SOURCE_NAME_DELETE_TABLE = str.maketrans("", "", " \t\n\r\f\v-_")
+
+
+def normalize_source_name(name: str) -> str:
+    """Normalize source name by removing spaces and special characters."""
+    return name.translate(_SOURCE_NAME_DELETE_TABLE)
+
+
+# The collections are static, so the tables used to resolve and validate source
+# names are built once at import and shared by the CLI and the API
+# Normalized name -> (original name, source object)
+SOURCE_MAPPING: Dict[str, Tuple[str, Publisher]] = {
+    normalize_source_name(name): (name, source)
+    for collection in PUBLISHER_COLLECTIONS_LIST
+    for name, source in collection_members(collection)
+}
+
+# "Display name (original name)" entries listed when a source is not recognised
+VALID_SOURCE_DISPLAY_SORTED = sorted(
+    f"{' '.join(word for word in name if word.isupper() or word == name[0])} ({name})"
+    for name, _ in SOURCE_MAPPING.values()
+)
+
+# Collection -> region, and publisher -> region of the collection it belongs to
+_COLLECTION_REGIONS = {
+    collection: region for region, collection in PUBLISHER_COLLECTIONS.items()
+}
+_PUBLISHER_REGIONS = {
+    publisher: region
+    for region, collection in reversed(PUBLISHER_COLLECTIONS.items())
+    for _, publisher in collection_members(collection)
+}
+
+
+class PollingTimeout:
+    """Ends the crawl at the first article that arrives after the deadline."""
+
+    def __init__(self, seconds: int):
+        self.seconds = seconds
+        self.deadline = None
+
+    def start(self):
+        self.deadline = time.monotonic() + self.seconds
+
+    def check(self):
+        if time.monotonic() > self.deadline:
+            raise TimeoutError("Crawler operation timed out")
+
+    def cancel(self):
+        pass
+
+
+class SignalTimeout(PollingTimeout):
+    """Interrupts the crawl with SIGALRM, even while it waits on a slow publisher.
+
+    Signals are only delivered to the main thread, so this only suits the CLI.
+    """
+
+    def start(self):
+        self._original_handler = signal.signal(signal.SIGALRM, cli_timeout_handler)
+        signal.alarm(self.seconds)
+
+    def check(self):
+        pass
+
+    def cancel(self):
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, self._original_handler)
+
+
 def format_sources(sources_list):
     """Format sources list in a readable way, grouped by region."""
     # Initialize source lists for each region
@@ -56,30 +301,20 @@ def format_sources(sources_list):
     for source in sources_list:
         # Handle collection objects
         if isinstance(source, type(PublisherCollection.us)):
-            # Extract all publishers from the collection
-            for name, publisher in vars(source).items():
-                if not name.startswith("__") and hasattr(publisher, "name"):
-                    # Find which collection this publisher belongs to
-                    for region, collection in PUBLISHER_COLLECTIONS.items():
-                        if source == collection:
-                            sources_by_region[region].append(publisher.name)
-                            break
+            region = _COLLECTION_REGIONS.get(source)
+            if region:
+                sources_by_region[region].extend(
+                    publisher.name for _, publisher in collection_members(source)
+                )
             continue
 
         # Handle individual publisher objects
         source_name = getattr(source, "name", None)
         if source_name:
-            # Check which collection it belongs to by comparing the actual source object
-            found = False
-            for region, collection in PUBLISHER_COLLECTIONS.items():
-                for class_name, publisher in vars(collection).items():
-                    if not class_name.startswith("__") and publisher == source:
-                        sources_by_region[region].append(source_name)
-                        found = True
-                        break
-                if found:
-                    break
-            if not found:
+            region = _PUBLISHER_REGIONS.get(source)
+            if region:
+                sources_by_region[region].append(source_name)
+            else:
                 unknown_sources.append(source_name)
         else:
             print(
@@ -104,12 +339,18 @@ def format_sources(sources_list):
 
 
 class BaseCrawler(ABC):
+    # How the crawl timeout is enforced; see PollingTimeout and SignalTimeout
+    timeout_class = PollingTimeout
+    # Set once a crawl stops at its timeout, so callers can tell its results are partial
+    timed_out = False
+
     def __init__(
         self,
         sources,
         max_articles: int,
         days: int,
         timeout_seconds: Optional[int] = None,
+        display_output: bool = True,
     ):
         if days <= 0:
             raise ValueError("days must be greater than 0")
@@ -122,14 +363,15 @@ class BaseCrawler(ABC):
         sources_list = (
             [sources] if not isinstance(sources, (list, tuple)) else list(sources)
         )
-        print("\nProcessing crawler initialization...")
-        # print(f"Source input type: {type(sources)}")
-        formatted_sources = format_sources(sources_list)
-        if formatted_sources:
-            print("\nInitialized crawler with sources:")
-            print(formatted_sources)
-        else:
-            print("\nWARNING: No valid sources found during initialization")
+        if display_output:
+            print("\nProcessing crawler initialization...")
+            # print(f"Source input type: {type(sources)}")
+            formatted_sources = format_sources(sources_list)
+            if formatted_sources:
+                print("\nInitialized crawler with sources:")
+                print(formatted_sources)
+            else:
+                print("\nWARNING: No valid sources found during initialization")
 
         # NOTE: adding restrict_sources_to=[Sitemap] makes The Guardian not work
         self.crawler = Crawler(sources_list)
@@ -137,78 +379,84 @@ class BaseCrawler(ABC):
         self.max_articles = max_articles
         self.days = days
         self.timeout_seconds = timeout_seconds
-        self.start_date = datetime.date.today() - datetime.timedelta(days=days)
+        # The search window is fixed for the whole crawl, so work it out once here
         # TODO: Allow end date to be passed in instead of assuming it's today
+        self.end_date = datetime.date.today()
+        self.start_date = self.end_date - datetime.timedelta(days=days)
 
     @abstractmethod
     def get_filter_params(self) -> Dict[str, Any]:
         pass
 
     def publishing_date_filter(self, extracted: Dict[str, Any]) -> bool:
-        end_date = datetime.date.today() - datetime.timedelta(
-            days=0
-        )  # TODO: allowing a range of dates instead of forcing to end today would be nice
-        start_date = end_date - datetime.timedelta(days=self.days)
         if publishing_date := extracted.get("publishing_date"):
-            return not (start_date <= publishing_date.date() <= end_date)
+            return not (self.start_date <= publishing_date.date() <= self.end_date)
         return True
 
-    def run_crawler(
+    def url_date_filter(self, url: str) -> bool:
+        """Drop URLs dated well outside the search window before they are downloaded.
+
+        publishing_date_filter only runs once fundus has downloaded and parsed the
+        article; many publishers put the date in the URL, which is enough to skip
+        both. URLs without a date are left for publishing_date_filter.
+        """
+        date = url_date(url)
+        if date is None:
+            return False
+        return not (
+            self.start_date - URL_DATE_SLACK <= date <= self.end_date + URL_DATE_SLACK
+        )
+
+    def iter_articles(
         self, display_output: bool = True, show_body: bool = True
-    ) -> List[Article]:
+    ) -> Iterator[Article]:
+        """Yield matching articles as soon as the crawl produces them.
+
+        display_output prints each article and progress notes to stdout, which is
+        only useful in a terminal; API callers should pass False.
+        """
         filter_params = self.get_filter_params()
-        articles = []
-        start_time = time.time()
-        error_count = 0
-        max_retries = 3
-
-        # Set up the timeout handler
-        timer = None
-        timeout_event = threading.Event()
-        if self.timeout_seconds:
-            timer = threading.Timer(
-                self.timeout_seconds, timeout_handler, args=(timeout_event,)
-            )
-            timer.start()
-            print(f"Set crawler timeout for {self.timeout_seconds} seconds")
+        article_count = 0
+        start_time = time.monotonic()
+
+        timeout = (
+            self.timeout_class(self.timeout_seconds) if self.timeout_seconds else None
+        )
+        if timeout:
+            timeout.start()
+            if display_output:
+                print(f"Set crawler timeout for {self.timeout_seconds} seconds")
 
         try:
             article_iterator = self.crawler.crawl(
                 max_articles=self.max_articles, **filter_params
             )
+            mount_fetch_adapters()
 
             while True:
-                # Check for timeout
-                if timeout_event.is_set():
-                    raise TimeoutError("Crawler operation timed out")
-
                 try:
-                    # Check for timeout again before fetching next article
-                    if timeout_event.is_set():
-                        raise TimeoutError("Crawler operation timed out")
-
                     article = next(article_iterator, None)
                     if article is None:  # No more articles
                         break
 
                     # Check for timeout after fetching article
-                    if timeout_event.is_set():
-                        raise TimeoutError("Crawler operation timed out")
-
-                    # Check if we have a valid publishing date
-                    if (
-                        not hasattr(article, "publishing_date")
-                        or article.publishing_date is None
-                    ):
+                    if timeout:
+                        timeout.check()
+
+                    # Check if we have a valid publishing date (read once; fundus
+                    # raises a formatted AttributeError for every missing lookup)
+                    publishing_date = getattr(article, "publishing_date", None)
+                    if publishing_date is None:
                         if display_output:
                             print("\nSkipping article with no publishing date")
                         continue
 
-                    # URL filters don't check date because they only look at the URLs, so it's done here instead
-                    if article.publishing_date.date() >= self.start_date:
+                    # The crawlers' extraction filters already check dates; this catches anything left
+                    if publishing_date.date() >= self.start_date:
                         if display_output:
                             display(article, show_body=show_body)
-                        articles.append(article)
+                        article_count += 1
+                        yield article
                     elif self.max_articles:
                         if display_output:
                             print("\n(Skipping display of older article.)")
@@ -217,21 +465,12 @@ class BaseCrawler(ABC):
                         if display_output:
                             print(".")
 
-                except (
-                    requests.exceptions.RequestException,
-                    requests.exceptions.ConnectionError,
-                ) as e:
-                    error_count += 1
-                    if error_count >= max_retries:
-                        raise NetworkError(
-                            f"Network error after {max_retries} retries: {str(e)}"
-                        )
-                    if display_output:
-                        print(
-                            f"\nNetwork error encountered, retrying ({error_count}/{max_retries})..."
-                        )
-                    time.sleep(1)  # Add a small delay before retrying
-                    continue
+                except requests.exceptions.RequestException as e:
+                    # Requests are already retried by urllib3, and fundus's iterator
+                    # is finished once an error escapes it, so there is nothing to retry
+                    raise NetworkError(
+                        f"Network error after {FETCH_RETRIES.total} retries: {str(e)}"
+                    )
                 except AttributeError as e:
                     if display_output:
                         print(f"\nSkipping article due to missing attribute: {str(e)}")
@@ -239,13 +478,14 @@ class BaseCrawler(ABC):
                 except TimeoutError as e:
                     if str(e) == "Crawler operation timed out":
                         # This is our intentional timeout, handle it gracefully
-                        elapsed_time = time.time() - start_time
+                        self.timed_out = True
+                        elapsed_time = time.monotonic() - start_time
                         if display_output:
                             print(
-                                f"\nTimeout reached after {elapsed_time:.1f} seconds (limit was {self.timeout_seconds} seconds). Returning {len(articles)} articles collected so far."
+                                f"\nTimeout reached after {elapsed_time:.1f} seconds (limit was {self.timeout_seconds} seconds). Returning {article_count} articles collected so far."
                             )
                             print_divider()
-                        return articles
+                        return
                     else:
                         # This is an unexpected timeout error
                         if display_output:
@@ -261,145 +501,100 @@ class BaseCrawler(ABC):
         except TimeoutError as e:
             if str(e) == "Crawler operation timed out":
                 # This is our intentional timeout, handle it gracefully
-                elapsed_time = time.time() - start_time
+                self.timed_out = True
+                elapsed_time = time.monotonic() - start_time
                 if display_output:
                     print(
-                        f"\nTimeout reached after {elapsed_time:.1f} seconds (limit was {self.timeout_seconds} seconds). Returning {len(articles)} articles collected so far."
+                        f"\nTimeout reached after {elapsed_time:.1f} seconds (limit was {self.timeout_seconds} seconds). Returning {article_count} articles collected so far."
                     )
                     print_divider()
-                return articles
+                return
             else:
                 # This is an unexpected timeout error
                 if display_output:
                     print(f"\nUnexpected timeout error: {str(e)}")
                 raise
 
+        except NetworkError:
+            raise
         except Exception as e:
             if display_output:
                 print(f"\nError during crawling: {type(e).__name__}: {str(e)}")
                 print_divider()
             raise CrawlerError(f"Crawler error: {str(e)}")
-
         finally:
-            if timer:
-                timer.cancel()  # Cancel the timer if it's still running
+            if timeout:
+                timeout.cancel()
 
         if display_output:
-            print(f"\nCrawling completed. Found {len(articles)} article(s).")
+            print(f"\nCrawling completed. Found {article_count} article(s).")
             print_divider()
 
-        return articles
-
-
-class CLICrawler(BaseCrawler):
-    """A version of BaseCrawler that uses signal-based timeouts for CLI mode."""
-
     def run_crawler(
         self, display_output: bool = True, show_body: bool = True
     ) -> List[Article]:
-        filter_params = self.get_filter_params()
-        articles = []
-        start_time = time.time()
-        error_count = 0
-        max_retries = 3
-
-        # Set up the timeout handler using signal
-        original_handler = None
-        if self.timeout_seconds:
-            original_handler = signal.signal(signal.SIGALRM, cli_timeout_handler)
-            signal.alarm(self.timeout_seconds)
-            print(f"Set crawler timeout for {self.timeout_seconds} seconds")
-
-        try:
-            article_iterator = self.crawler.crawl(
-                max_articles=self.max_articles, **filter_params
-            )
+        return list(
+            self.iter_articles(display_output=display_output, show_body=show_body)
+        )
 
-            while True:
-                try:
-                    article = next(article_iterator, None)
-                    if article is None:  # No more articles
-                        break
+    def _collect_articles(
+        self, display_output: bool = True, show_body: bool = True
+    ) -> List[Article]:
+        for article in self.iter_articles(
+            display_output=display_output, show_body=show_body
+        ):
+            self._partial.append(article)
+        return self._partial
 
-                    # Check if we have a valid publishing date
-                    if (
-                        not hasattr(article, "publishing_date")
-                        or article.publishing_date is None
-                    ):
-                        if display_output:
-                            print("\nSkipping article with no publishing date")
-                        continue
+    def partial_results(self) -> List[Article]:
+        """Articles collected so far by run_crawler_async."""
+        return list(self._partial)
 
-                    # URL filters don't check date because they only look at the URLs, so it's done here instead
-                    if article.publishing_date.date() >= self.start_date:
-                        if display_output:
-                            display(article, show_body=show_body)
-                        articles.append(article)
-                    elif self.max_articles:
-                        if display_output:
-                            print("\n(Skipping display of older article.)")
-                            print_divider()
-                    else:
-                        if display_output:
-                            print(".")
-
-                except (
-                    requests.exceptions.RequestException,
-                    requests.exceptions.ConnectionError,
-                ) as e:
-                    error_count += 1
-                    if error_count >= max_retries:
-                        raise NetworkError(
-                            f"Network error after {max_retries} retries: {str(e)}"
-                        )
-                    if display_output:
-                        print(
-                            f"\nNetwork error encountered, retrying ({error_count}/{max_retries})..."
-                        )
-                    time.sleep(1)  # Add a small delay before retrying
-                    continue
-                except AttributeError as e:
-                    if display_output:
-                        print(f"\nSkipping article due to missing attribute: {str(e)}")
-                    continue
-                except TimeoutError as e:
-                    # This is our intentional timeout, handle it gracefully
-                    elapsed_time = time.time() - start_time
-                    if display_output:
-                        print(
-                            f"\nTimeout reached after {elapsed_time:.1f} seconds (limit was {self.timeout_seconds} seconds). Returning {len(articles)} articles collected so far."
-                        )
-                        print_divider()
-                    return articles
-                except Exception as e:
-                    if display_output:
-                        print(
-                            f"\nUnexpected error processing article: {type(e).__name__}: {str(e)}"
-                        )
-                    continue
+    async def run_crawler_async(
+        self,
+        display_output: bool = True,
+        show_body: bool = True,
+        executor: Optional[Executor] = None,
+    ) -> List[Article]:
+        """Run the crawler without blocking the event loop.
+
+        fundus owns the HTTP layer and already fetches publishers concurrently
+        (one thread per publisher), so the blocking crawl is handed to an
+        executor (the loop's default one unless another is given) and the
+        caller just awaits the result. The in-crawl timeout is
+        only checked between articles, so the wait itself is also bounded: if a
+        slow publisher holds up the next article past the deadline, the articles
+        collected so far are returned without waiting for it.
+        """
+        self._partial = []
+        loop = asyncio.get_running_loop()
+        crawl = loop.run_in_executor(
+            executor,
+            functools.partial(
+                self._collect_articles,
+                display_output=display_output,
+                show_body=show_body,
+            ),
+        )
+        if not self.timeout_seconds:
+            return await crawl
 
-        except TimeoutError as e:
-            # This is our intentional timeout, handle it gracefully
-            elapsed_time = time.time() - start_time
+        try:
+            return await asyncio.wait_for(
+                crawl, timeout=self.timeout_seconds + ASYNC_TIMEOUT_GRACE_SECONDS
+            )
+        except asyncio.TimeoutError:
+            # The crawl thread will stop by itself at its next article, once past its deadline
+            self.timed_out = True
             if display_output:
                 print(
-                    f"\nTimeout reached after {elapsed_time:.1f} seconds (limit was {self.timeout_seconds} seconds). Returning {len(articles)} articles collected so far."
+                    f"\nNo article arrived before the {self.timeout_seconds} second timeout. Returning {len(self._partial)} articles collected so far."
                 )
                 print_divider()
-            return articles
-        except Exception as e:
-            if display_output:
-                print(f"\nError during crawling: {type(e).__name__}: {str(e)}")
-                print_divider()
-            raise CrawlerError(f"Crawler error: {str(e)}")
-        finally:
-            # Restore the original signal handler and cancel any pending alarm
-            if original_handler:
-                signal.alarm(0)
-                signal.signal(signal.SIGALRM, original_handler)
+            return self.partial_results()
 
-        if display_output:
-            print(f"\nCrawling completed. Found {len(articles)} article(s).")
-            print_divider()
 
-        return articles
+class CLICrawler(BaseCrawler):
+    """A version of BaseCrawler that uses signal-based timeouts for CLI mode."""
+
+    timeout_class = SignalTimeout
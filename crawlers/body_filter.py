@@ -1,5 +1,5 @@
-from typing import Dict, List, Any, Optional
-from fundus.scraping.filter import inverse, regex_filter, lor, land
+import re
+from typing import Dict, List, Any, Optional, Tuple
 from crawlers.base_crawler import BaseCrawler
 from crawlers.helpers import print_divider
 from fundus import Article
@@ -13,19 +13,55 @@ class BodyFilterCrawler(BaseCrawler):
         days: int,
         body_search_terms: List[str],
         timeout_seconds: Optional[int] = None,
+        display_output: bool = True,
+        keep_rendered_bodies: bool = False,
     ):
-        super().__init__(sources, max_articles, days, timeout_seconds=timeout_seconds)
+        super().__init__(
+            sources,
+            max_articles,
+            days,
+            timeout_seconds=timeout_seconds,
+            display_output=display_output,
+        )
         self.body_search_terms = body_search_terms
+        # Terms are case-folded and de-duplicated once here, and a single alternation
+        # of them scans each body once, however many terms there are
+        folded_terms = dict.fromkeys(term.casefold() for term in body_search_terms)
+        self.body_search_pattern = (
+            re.compile("|".join(re.escape(term) for term in folded_terms))
+            if folded_terms
+            else None
+        )
+        # id(body) -> (body, rendered text) for bodies that matched, so serializing
+        # the article does not render the body a second time. Only for callers that
+        # pop the entries again (the API's serializer); at most max_articles are kept,
+        # since articles fundus drops after filtering never get popped.
+        self.rendered_bodies: Optional[Dict[int, Tuple[Any, str]]] = (
+            {} if keep_rendered_bodies else None
+        )
 
     def body_filter(self, extracted: Dict[str, Any]) -> bool:
-        if body := extracted.get("body"):
-            for word in self.body_search_terms:
-                if word in str(body).casefold():
-                    return False
+        if self.body_search_pattern and (body := extracted.get("body")):
+            text = str(body)
+            if self.body_search_pattern.search(text.casefold()):
+                if self.rendered_bodies is not None and (
+                    self.max_articles is None
+                    or len(self.rendered_bodies) < self.max_articles
+                ):
+                    # The entry holds the body itself, so its id cannot be reused meanwhile
+                    self.rendered_bodies[id(body)] = (body, text)
+                return False
         return True
 
+    def extraction_filter(self, extracted: Dict[str, Any]) -> bool:
+        # Same as fundus's lor(publishing_date_filter, body_filter), minus the generator it runs per article
+        return self.publishing_date_filter(extracted) or self.body_filter(extracted)
+
     def get_filter_params(self) -> Dict[str, Any]:
-        return {"only_complete": lor(self.publishing_date_filter, self.body_filter)}
+        return {
+            "url_filter": self.url_date_filter,
+            "only_complete": self.extraction_filter,
+        }
 
     def run_crawler(
         self, display_output: bool = True, show_body: bool = True
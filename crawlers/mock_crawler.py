@@ -1,9 +1,28 @@
-from typing import Dict, List, Any, Optional
-from .base_crawler import BaseCrawler
+import functools
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+from fundus.publishers.base_objects import Publisher
+from .base_crawler import BaseCrawler, collection_members
 from .mock_data import get_mock_articles
 from fundus import Article
 
 
+@functools.lru_cache(maxsize=256)
+def _source_names(source) -> Tuple[str, ...]:
+    """Publisher names for a collection, a publisher or a plain name.
+
+    Sources are fixed objects and the same selections come up again and again,
+    so each one is only resolved once.
+    """
+    # If it's a direct publisher object
+    if isinstance(source, Publisher):
+        return (source.name,)
+    # If it's already a string
+    if isinstance(source, str):
+        return (source,)
+    # If it's a collection (like PublisherCollection.us)
+    return tuple(publisher.name for _, publisher in collection_members(source))
+
+
 class MockCrawler(BaseCrawler):
     def __init__(
         self,
@@ -28,17 +47,7 @@ class MockCrawler(BaseCrawler):
         """Extract source names from source objects or collections."""
         source_names = set()
         for source in sources:
-            # If it's a collection (like PublisherCollection.us)
-            if hasattr(source, "__dict__"):
-                for name, publisher in vars(source).items():
-                    if not name.startswith("__") and hasattr(publisher, "name"):
-                        source_names.add(publisher.name)
-            # If it's a direct publisher object
-            elif hasattr(source, "name"):
-                source_names.add(source.name)
-            # If it's already a string
-            elif isinstance(source, str):
-                source_names.add(source)
+            source_names.update(_source_names(source))
         return list(source_names)
 
     def get_filter_params(self) -> Dict[str, Any]:
@@ -71,3 +80,9 @@ class MockCrawler(BaseCrawler):
             print(f"\nFound {len(articles)} mock article(s)")
 
         return articles
+
+    def iter_articles(
+        self, display_output: bool = True, show_body: bool = True
+    ) -> Iterator[Article]:
+        # Mock data is filtered in one go, so there is nothing to stream incrementally
+        yield from self.run_crawler(display_output=display_output, show_body=show_body)
@@ -1,12 +1,10 @@
-from typing import List, Optional
+import functools
+import re
+from bisect import bisect_right
+from typing import List, Optional, Pattern, Tuple
 from datetime import datetime, timedelta
 from fundus import Article
-
-
-def normalize_source_name(name: str) -> str:
-    """Normalize source name by removing spaces and special characters."""
-    return "".join(name.split())
-
+from crawlers.base_crawler import normalize_source_name
 
 MOCK_ARTICLES = [
     {
@@ -101,40 +99,58 @@ The future of sustainable energy looks promising, with continued innovation driv
     },
 ]
 
+# Newest first, so the articles recent enough for a search are always a prefix
+MOCK_ARTICLES.sort(
+    key=lambda article_data: article_data["publishing_date"], reverse=True
+)
 
-class MockArticle:
-    def __init__(self, data: dict):
-        self._title = data["title"]
-        self._url = data["url"]
-        self._body = data["body"]
-        self._source = data["source"]
-        self._publishing_date = data["publishing_date"]
-        self._authors = data.get("authors", [])  # Use get() with default empty list
-        self.html = type("HTML", (), {"requested_url": data["url"]})()
+# The mock data never changes, so what the filters look at is worked out once here and
+# kept in parallel tuples (index i describes MOCK_ARTICLES[i]), letting a search scan
+# plain sequences instead of looking keys up in every article dict
+# Negated timestamps ascend, so bisect finds where articles become too old
+_NEGATED_TIMESTAMPS = tuple(
+    -article_data["publishing_date"].timestamp() for article_data in MOCK_ARTICLES
+)
+_SOURCES_NORM = tuple(
+    normalize_source_name(article_data["source"]) for article_data in MOCK_ARTICLES
+)
+_TEXTS_LC = tuple(
+    (article_data["title"] + " " + article_data["body"]).lower()
+    for article_data in MOCK_ARTICLES
+)
+_URLS_LC = tuple(article_data["url"].lower() for article_data in MOCK_ARTICLES)
 
-    @property
-    def title(self):
-        return self._title
 
-    @property
-    def url(self):
-        return self._url
+class _MockHTML:
+    """Stands in for fundus's HTML object, which is only read for requested_url."""
 
-    @property
-    def body(self):
-        return self._body
+    __slots__ = ("requested_url",)
 
-    @property
-    def source(self):
-        return self._source
+    def __init__(self, requested_url: str):
+        self.requested_url = requested_url
 
-    @property
-    def publishing_date(self):
-        return self._publishing_date
 
-    @property
-    def authors(self):
-        return self._authors
+class MockArticle:
+    # Plain slots instead of read-only properties: no per-instance __dict__ and
+    # no extra call on every attribute read
+    __slots__ = ("title", "url", "body", "source", "publishing_date", "authors", "html")
+
+    def __init__(self, data: dict):
+        self.title = data["title"]
+        self.url = data["url"]
+        self.body = data["body"]
+        self.source = data["source"]
+        self.publishing_date = data["publishing_date"]
+        self.authors = data.get("authors", [])  # Use get() with default empty list
+        self.html = _MockHTML(data["url"])
+
+
+@functools.lru_cache(maxsize=128)
+def _terms_pattern(terms: Tuple[str, ...]) -> Optional[Pattern]:
+    """One alternation of the lowercased terms, so each text is scanned only once."""
+    if not terms:
+        return None
+    return re.compile("|".join(re.escape(term.lower()) for term in terms))
 
 
 def get_mock_articles(
@@ -153,50 +169,43 @@ def get_mock_articles(
 
     print(f"Mock search type: {'URL' if is_url_search else 'Body'}")
 
-    # Normalize source names for comparison
+    include_pattern = _terms_pattern(tuple(include_terms))
+    exclude_pattern = _terms_pattern(tuple(exclude_terms or ()))
+
+    # Normalize source names for comparison (a set, as every article is checked against it)
     normalized_sources = (
-        [normalize_source_name(s) for s in sources] if sources else None
+        frozenset(map(normalize_source_name, sources)) if sources else None
     )
 
-    for article_data in MOCK_ARTICLES:
-        # Skip if article is too old
-        if article_data["publishing_date"] < cutoff_date:
-            print(f"Skipping article '{article_data['title']}' - too old")
-            continue
+    # A MockArticle is only built for articles that pass every check
+    search_texts = _URLS_LC if is_url_search else _TEXTS_LC
+    # Only the articles before this index are recent enough
+    recent_count = bisect_right(_NEGATED_TIMESTAMPS, -cutoff_date.timestamp())
+    if recent_count < len(MOCK_ARTICLES):
+        print(f"Skipping {len(MOCK_ARTICLES) - recent_count} article(s) - too old")
+
+    for i in range(recent_count):
+        article_data = MOCK_ARTICLES[i]
 
         # Check source filter
         if sources:
-            article_source = normalize_source_name(article_data["source"])
-            if article_source not in normalized_sources:
+            if _SOURCES_NORM[i] not in normalized_sources:
                 print(
                     f"Skipping article '{article_data['title']}' - source {article_data['source']} not in {sources}"
                 )
                 continue
 
-        # Create article instance
-        article = MockArticle(article_data)
-
-        # For URL search, check terms in URL
-        if is_url_search:
-            url_text = article.url.lower()
-
-            # Check include terms
-            if not any(term.lower() in url_text for term in include_terms):
-                continue
+        text = search_texts[i]
 
-            # Check exclude terms
-            if exclude_terms and any(
-                term.lower() in url_text for term in exclude_terms
-            ):
-                continue
-        else:
-            # For body search, check terms in title and body
-            text = (article.title + " " + article.body).lower()
+        # Check include terms (URL search looks at the URL, body search at title and body)
+        if not (include_pattern and include_pattern.search(text)):
+            continue
 
-            # Check include terms
-            if not any(term.lower() in text for term in include_terms):
-                continue
+        # Check exclude terms (URL search only)
+        if is_url_search and exclude_pattern and exclude_pattern.search(text):
+            continue
 
+        article = MockArticle(article_data)
         filtered_articles.append(article)
         print(f"Found matching article: {article.title}")
 
@@ -1,9 +1,13 @@
+import re
 from typing import Dict, Any, List, Optional
-from fundus.scraping.filter import inverse, regex_filter, lor, land
+from fundus.scraping.filter import Requires
 from crawlers.base_crawler import BaseCrawler
-from crawlers.helpers import display, print_divider
+from crawlers.helpers import print_divider
 from fundus import Article
 
+# fundus's default only_complete check, which passing our own filter replaces
+_REQUIRES_COMPLETE = Requires("title", "body", "publishing_date")
+
 
 class UrlFilterCrawler(BaseCrawler):
     def __init__(
@@ -14,23 +18,46 @@ class UrlFilterCrawler(BaseCrawler):
         filter_include_terms: List[str],
         filter_out_terms: List[str],
         timeout_seconds: Optional[int] = None,
+        display_output: bool = True,
     ):
-        super().__init__(sources, max_articles, days, timeout_seconds=timeout_seconds)
+        super().__init__(
+            sources,
+            max_articles,
+            days,
+            timeout_seconds=timeout_seconds,
+            display_output=display_output,
+        )
         self.filter_out_terms_list = filter_out_terms
         self.filter_include_terms_list = filter_include_terms
+        # Compile the terms once instead of looking them up in re's cache for every URL
+        self.include_patterns = [re.compile(term) for term in filter_include_terms]
+        # Only use filter_out if there are actual terms to filter out
+        self.filter_out_pattern = (
+            re.compile("|".join(filter_out_terms)) if filter_out_terms else None
+        )
 
-    def get_filter_params(self) -> Dict[str, Any]:
-        filter_include_terms = [
-            regex_filter(term) for term in self.filter_include_terms_list
-        ]
-        filter_include = inverse(land(*filter_include_terms))
+    def url_filter(self, url: str) -> bool:
+        # fundus drops URLs for which the filter returns True
+        if self.filter_out_pattern and self.filter_out_pattern.search(url):
+            return True
+        if not all(pattern.search(url) for pattern in self.include_patterns):
+            return True
+        return self.url_date_filter(url)
 
-        # Only use filter_out if there are actual terms to filter out
-        if self.filter_out_terms_list and len(self.filter_out_terms_list) > 0:
-            filter_out_terms = "|".join(self.filter_out_terms_list)
-            filter_out = regex_filter(filter_out_terms)
-            return {"url_filter": lor(filter_out, filter_include)}
-        return {"url_filter": filter_include}
+    def extraction_filter(self, extracted: Dict[str, Any]) -> bool:
+        # Drop articles outside the date window or missing a title, body or date
+        return self.publishing_date_filter(extracted) or bool(
+            _REQUIRES_COMPLETE(extracted)
+        )
+
+    def get_filter_params(self) -> Dict[str, Any]:
+        # The URL filter runs before download and drops URLs dated outside the window;
+        # the rest are date-checked after parsing, which keeps stale articles from
+        # counting towards max_articles
+        return {
+            "url_filter": self.url_filter,
+            "only_complete": self.extraction_filter,
+        }
 
     def run_crawler(
         self, display_output: bool = True, show_body: bool = True
@@ -1,68 +1,37 @@
 import argparse
+import logging
 import uvicorn
-from fundus import PublisherCollection
 from crawlers import BodyFilterCrawler, UrlFilterCrawler
 from crawlers.helpers import print_exclude_not_implemented
 from typing import Optional, List
 from crawlers.base_crawler import (
-    CrawlerError,
-    NetworkError,
-    TimeoutError,
-    PUBLISHER_COLLECTIONS,
     PUBLISHER_COLLECTIONS_LIST,
+    SOURCE_MAPPING,
+    VALID_SOURCE_DISPLAY_SORTED,
     CLICrawler,
+    normalize_source_name,
 )
 
 
-def normalize_source_name(name: str) -> str:
-    """Normalize source name by removing spaces and special characters."""
-    return "".join(name.split())
-
-
 def get_sources(source_names: Optional[List[str]] = None):
     if not source_names:
-        return (
-            PublisherCollection.us,
-            PublisherCollection.uk,
-            PublisherCollection.au,
-            PublisherCollection.ca,
-        )
-
-    # Create a mapping of normalized names to actual source objects
-    source_mapping = {}
-    for collection in PUBLISHER_COLLECTIONS_LIST:
-        for name, source in vars(collection).items():
-            if not name.startswith("__"):
-                source_mapping[normalize_source_name(name)] = (name, source)
+        return tuple(PUBLISHER_COLLECTIONS_LIST)
 
     sources = []
     invalid_sources = []
     for name in source_names:
         normalized_name = normalize_source_name(name)
-        if normalized_name in source_mapping:
-            original_name, source = source_mapping[normalized_name]
+        if normalized_name in SOURCE_MAPPING:
+            original_name, source = SOURCE_MAPPING[normalized_name]
             sources.append(source)
             print(f"Found {name} (matched as {original_name})")
         else:
             invalid_sources.append(name)
 
     if invalid_sources:
-        # Get list of valid sources with their display names
-        valid_sources = {}
-        for collection in PUBLISHER_COLLECTIONS_LIST:
-            for name, source in vars(collection).items():
-                if not name.startswith("__"):
-                    display_name = " ".join(
-                        word for word in name if word.isupper() or word == name[0]
-                    )
-                    valid_sources[name] = display_name
-
-        valid_source_display = [
-            f"{display} ({name})" for name, display in valid_sources.items()
-        ]
         raise ValueError(
             f"Invalid source(s): {', '.join(invalid_sources)}.\n"
-            f"Valid sources are: {', '.join(sorted(valid_source_display))}"
+            f"Valid sources are: {', '.join(VALID_SOURCE_DISPLAY_SORTED)}"
         )
 
     return tuple(sources)
@@ -218,6 +187,11 @@ if __name__ == "__main__":
         action="store_true",
         help="Use mock data instead of real crawling (for testing)",
     )
+    parser.add_argument(
+        "--no_access_log",
+        action="store_true",
+        help="Turn off uvicorn's per-request access log",
+    )
 
     args = parser.parse_args()
 
@@ -237,9 +211,21 @@ if __name__ == "__main__":
     else:  # api mode
         from api import app
 
+        # Send the API's log records to stderr once, before the server starts
+        logging.basicConfig(
+            level=logging.INFO, format="%(levelname)s: %(name)s: %(message)s"
+        )
         print(f"Starting API server on {args.host}:{args.port}")
         print("API documentation available at http://127.0.0.1:8000/docs")
         if args.mock:
             print("Running in mock mode - using test data instead of real crawling")
             app.state.use_mock = True
-        uvicorn.run(app, host=args.host, port=args.port)
+        # uvloop and httptools come with uvicorn[standard]
+        uvicorn.run(
+            app,
+            host=args.host,
+            port=args.port,
+            loop="uvloop",
+            http="httptools",
+            access_log=not args.no_access_log,
+        )